@@ -1 +1 @@
-from .utils import ScriptError, bash, info, error, format_duration, ensure_repo
+from .utils import ScriptError, bash, run_python, info, error, format_duration, ensure_repo
@@ -1,4 +1,7 @@
+import codecs
+import os
 import subprocess
+import sys
 from pathlib import Path
 from rich.console import Console
 
@@ -39,15 +42,17 @@ def bash(command: str, directory: str | Path = None) -> str:
         cwd=dir_path,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,  # Merge stderr into stdout
-        text=True,
-        bufsize=1,  # Line buffered
     )
 
-    # Capture output while streaming it in real-time
-    output_lines = []
-    for line in process.stdout:
-        output_lines.append(line)
-        console.print(line, style="bright_black", end="", highlight=False, markup=False)
+    # Capture output while streaming it in real-time, reading whatever is available rather than
+    # going line by line; the incremental decoder holds back characters split across reads
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    output_chunks = []
+    while chunk := os.read(process.stdout.fileno(), 65536):
+        text = decoder.decode(chunk)
+        output_chunks.append(text)
+        console.print(text, style="bright_black", end="", highlight=False, markup=False)
+    output_chunks.append(decoder.decode(b"", final=True))
 
     # Wait for process to complete and get return code
     returnCode = process.wait()
@@ -62,7 +67,47 @@ def bash(command: str, directory: str | Path = None) -> str:
         raise ScriptError(f"Command {command} returned {returnCode}")
 
     # Return the captured output
-    return "".join(output_lines)
+    return "".join(output_chunks)
+
+
+def run_python(venv_dir: Path, script: str | Path, *args, directory: str | Path = None, env_extra: dict = None):
+    """
+    Run a Python script with a virtual environment's interpreter, without going through a shell.
+
+    Output is inherited from this process rather than piped, so long-running tools print progress live.
+
+    Args:
+        venv_dir: The virtual environment whose interpreter runs the script
+        script: Path to the script to run
+        *args: Arguments passed to the script
+        directory: The directory in which to run the script (defaults to script's directory)
+        env_extra: Extra environment variables for the child process
+
+    Raises:
+        ScriptError: If the script exits with a non-zero status code
+    """
+    if directory is None:
+        directory = Path(script).parent
+
+    venv_dir = Path(venv_dir)
+    argv = [str(venv_dir / "bin" / "python"), str(script), *map(str, args)]
+
+    # Equivalent to sourcing bin/activate
+    env = {
+        **os.environ,
+        "VIRTUAL_ENV": str(venv_dir),
+        "PATH": f"{venv_dir}/bin:{os.environ['PATH']}",
+        **(env_extra or {}),
+    }
+
+    console.print(f"$ {' '.join(argv)}", style="yellow", highlight=False)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    returnCode = subprocess.run(argv, cwd=Path(directory), env=env, stdout=sys.stdout, stderr=sys.stderr).returncode
+
+    if returnCode != 0:
+        raise ScriptError(f"Command {' '.join(argv)} returned {returnCode}")
 
 
 def info(msg):
@@ -109,6 +154,12 @@ def ensure_repo(repo_dir: Path, url: str, ref: str, name: str = None):
 
     is_sha = _is_commit_sha(ref)
 
+    # Submodule fetches are network-bound, so run them concurrently rather than one at a time
+    submodule_update = (
+        "GIT_TERMINAL_PROMPT=0 git submodule update --init --recursive --depth 1 "
+        f"--jobs {os.cpu_count() or 1}"
+    )
+
     def needs_clone():
         """Check if repo needs to be cloned."""
         if not repo_dir.exists():
@@ -151,10 +202,7 @@ def ensure_repo(repo_dir: Path, url: str, ref: str, name: str = None):
             )
 
         # Initialize nested submodules
-        bash(
-            "GIT_TERMINAL_PROMPT=0 git submodule update --init --recursive --depth 1",
-            directory=repo_dir,
-        )
+        bash(submodule_update, directory=repo_dir)
         info(f"{name} cloned at {ref}")
         return
 
@@ -186,4 +234,4 @@ def ensure_repo(repo_dir: Path, url: str, ref: str, name: str = None):
         bash(f"GIT_TERMINAL_PROMPT=0 git fetch --depth 1 origin tag {ref}", directory=repo_dir)
         bash(f"git checkout {ref}", directory=repo_dir)
 
-    bash("GIT_TERMINAL_PROMPT=0 git submodule update --init --recursive --depth 1", directory=repo_dir)
+    bash(submodule_update, directory=repo_dir)
@@ -11,7 +11,7 @@ import shutil
 import time
 import urllib.request
 from pathlib import Path
-from build_utils import ScriptError, bash, info, error, format_duration, ensure_repo
+from build_utils import ScriptError, bash, run_python, info, error, format_duration, ensure_repo
 
 
 def create_openocr_venv(openocr_dir: Path) -> Path:
@@ -98,18 +98,18 @@ def build_svtr_model(openocr_dir: Path, venv_dir: Path, checkpoint_path: Path, w
     # Run OpenOCR's export_rec.py tool
     # Export config: shape [batch, channels, height, width], dynamic batch axis
     char_dict_path = openocr_dir / "tools" / "utils" / "ppocr_keys_v1.txt"
-    bash(
-        f"source {venv_dir}/bin/activate && "
-        f"python3 {openocr_dir}/tools/export_rec.py "
-        f"--config {openocr_dir}/configs/rec/svtrv2/repsvtr_ch.yml "
-        f"--type onnx "
-        f"-o Global.device=cpu "
-        f"Global.pretrained_model={checkpoint_path} "
-        f"Global.character_dict_path={char_dict_path} "
-        f"PostProcess.character_dict_path={char_dict_path} "
-        f"PostProcess.use_space_char=True "
-        f"Export.export_shape=[1,3,48,320] "
-        f"'Export.dynamic_axes=[0,3]' "
+    run_python(
+        venv_dir,
+        openocr_dir / "tools" / "export_rec.py",
+        "--config", openocr_dir / "configs" / "rec" / "svtrv2" / "repsvtr_ch.yml",
+        "--type", "onnx",
+        "-o", "Global.device=cpu",
+        f"Global.pretrained_model={checkpoint_path}",
+        f"Global.character_dict_path={char_dict_path}",
+        f"PostProcess.character_dict_path={char_dict_path}",
+        "PostProcess.use_space_char=True",
+        "Export.export_shape=[1,3,48,320]",
+        "Export.dynamic_axes=[0,3]",
         f"Export.export_dir={work_dir}",
         directory=openocr_dir,
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uvx marimo edit --sandbox --no-token --no-skew-protection --watch --port 3005
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["marimo", "numpy", "pandas", "seaborn", "scikit-learn", "notebook_utils"]
+# dependencies = ["marimo", "numpy", "pandas", "pyarrow", "seaborn", "scikit-learn", "notebook_utils"]
 #
 # [tool.uv.sources]
 # notebook_utils = { path = "notebook_utils", editable = true }
@@ -17,11 +17,14 @@ __generated_with = "0.18.4"
 app = marimo.App(width="medium")
 
 with app.setup:
+    import hashlib
     import marimo as mo
     import numpy as np
+    import os
     import pandas as pd
     import seaborn as sns
-    import matplotlib.pyplot as plt
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
     from pathlib import Path
     import time
     from notebook_utils import format_duration, prioritized_cores, run_benchmark, start_perf
@@ -29,6 +32,14 @@ with app.setup:
     sns.set_theme()
 
 
+@app.function
+def plot_by_parallelism(ax, data: pd.DataFrame, y: str) -> None:
+    """Draw one time-series line per parallelism level, colored from tab10."""
+    cmap = colormaps["tab10"]
+    for i, (parallelism, sub) in enumerate(data.groupby("parallelism", observed=True)):
+        ax.plot(sub["time_s"].to_numpy(), sub[y].to_numpy(), label=str(parallelism), color=cmap(i % cmap.N))
+
+
 @app.cell
 def _():
     default_model = mo.cli_args().get("model") or "dbnet"
@@ -42,7 +53,14 @@ def _():
 
 
 @app.cell
-def _(model_input):
+def _():
+    rerun_button = mo.ui.run_button(label="Rerun benchmark")
+    rerun_button
+    return (rerun_button,)
+
+
+@app.cell
+def _(model_input, rerun_button):
     def _():
         if model_input.value == "dbnet":
             duration = 8
@@ -57,103 +75,191 @@ def _(model_input):
         warmup = 2
         core_configs = prioritized_cores(max_cores)
 
-        def make_cmd(cores: list[int]) -> list[str]:
+        def make_cmd(cores: tuple[int, ...]) -> list[str]:
             return [
                 "dotnet", "run", str(script), "--",
                 "--model", model_input.value,
                 "--cores", *[str(c) for c in cores],
             ]
 
+        def with_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+            # Times stay as epoch seconds for arithmetic; timestamps are only for resampling and perf alignment
+            df["start_time"] = pd.to_datetime(df["start_s"], unit="s", utc=True)
+            df["end_time"] = pd.to_datetime(df["end_s"], unit="s", utc=True)
+            df["midpoint"] = pd.to_datetime((df["start_s"] + df["end_s"]) / 2, unit="s", utc=True)
+
+            # Parallelism is a small ordered key, so group and plot it by category code
+            df["parallelism"] = df["parallelism"].astype(pd.CategoricalDtype(np.unique(df["parallelism"]), ordered=True))
+
+            # Derived columns shared by the analysis cells below
+            df["duration_ms"] = ((df["end_s"] - df["start_s"]) * 1000).astype("float32")
+            # Classify cores: P-cores are 0-15, E-cores are 16-27
+            df["core_type"] = pd.Categorical.from_codes(
+                (df["core_id"].to_numpy() >= 16).astype(np.int8),
+                categories=["P-core", "E-core"],
+            )
+            return df
+
+        # Fingerprint the script and the projects it references, so rebuilding the engine invalidates the cache
+        projects = [script.parent / line.split(maxsplit=1)[1] for line in script.read_text().splitlines() if line.startswith("#:project ")]
+        sources_mtime = script.stat().st_mtime_ns
+        for project in projects:
+            for root, dirs, files in os.walk(project):
+                # Build output never feeds the benchmark, so don't descend into it at all
+                dirs[:] = [d for d in dirs if d not in {"bin", "obj"}]
+                for name in files:
+                    sources_mtime = max(sources_mtime, os.stat(os.path.join(root, name)).st_mtime_ns)
+
+        # Results are cached per configuration so reopening the notebook doesn't rerun dotnet
+        cache_key = hashlib.sha1(f"{model_input.value}-{max_cores}-{duration}-{warmup}-{sources_mtime}".encode()).hexdigest()[:12]
+        cache_dir = Path(__file__).parent / ".cache" / "bandwidth"
+        df_cache = cache_dir / f"{cache_key}-df.parquet"
+        perf_cache = cache_dir / f"{cache_key}-perf.parquet"
+        if df_cache.exists() and perf_cache.exists() and not rerun_button.value:
+            return with_derived_columns(pd.read_parquet(df_cache)), pd.read_parquet(perf_cache)
+
         estimated_total = len(core_configs) * (warmup + duration + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        # Accumulate results into typed column buffers, doubling capacity as needed
+        columns = {
+            "core_id": np.empty(4096, dtype=np.int8),
+            "parallelism": np.empty(4096, dtype=np.int8),
+            "start_s": np.empty(4096, dtype=np.float64),
+            "end_s": np.empty(4096, dtype=np.float64),
+        }
+        n = 0
+
         with mo.status.spinner(title="Running benchmark...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             perf = start_perf()
             for cores in core_configs:
-                for start_time, end_time, tags in run_benchmark(make_cmd(cores), duration, warmup):
+                for start_time, end_time, tags in run_benchmark(make_cmd(cores), duration, warmup, cores=cores):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "cores": cores,
-                        "core_id": int(tags["core_id"]),
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
+                    if n == len(columns["core_id"]):
+                        columns = {name: np.resize(col, 2 * n) for name, col in columns.items()}
+                    columns["core_id"][n] = int(tags["core_id"])
+                    columns["parallelism"][n] = len(cores)
+                    columns["start_s"][n] = start_time.timestamp()
+                    columns["end_s"][n] = end_time.timestamp()
+                    n += 1
             perf_df = perf.stop()
 
-        df = pd.DataFrame(rows)
-        df["parallelism"] = df["cores"].apply(len)
+        df = pd.DataFrame({name: col[:n] for name, col in columns.items()})
+
+        # Narrow perf metric dtypes to cut the bytes every resample has to move
+        perf_df = perf_df.astype({col: "float32" for col in perf_df.columns if col != "timestamp"})
 
-        return df, perf_df
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(df_cache, compression="zstd")
+        perf_df.to_parquet(perf_cache, compression="zstd")
+
+        return with_derived_columns(df), perf_df
 
     df, perf_df = _()
     return df, perf_df
 
 
+@app.cell
+def _(df):
+    # Shared grouping by parallelism level, reused by the analysis cells below
+    parallelism_groups = df.groupby("parallelism", observed=True, sort=False)
+    return (parallelism_groups,)
+
+
 @app.cell
 def _(df):
     def _():
-        # Compute midpoint for each inference
-        df["midpoint"] = df["start_time"] + (df["end_time"] - df["start_time"]) / 2
-
-        # Resample to 1-second bins per parallelism level
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            counts = g.set_index("midpoint").resample("1s").size()
-            t0 = counts.index.min()
-            for ts, count in counts.iloc[1:-1].items():  # Drop incomplete first/last bins
-                rows.append({
-                    "parallelism": parallelism,
-                    "time_s": (ts - t0).total_seconds(),
-                    "inferences_per_sec": count,
-                })
-
-        throughput_df = pd.DataFrame(rows)
-
-        # Filter to common time range (all groups have same extent)
-        max_common_time = throughput_df.groupby("parallelism")["time_s"].max().min()
-        return throughput_df[throughput_df["time_s"] <= max_common_time]
+        # Whole seconds since each run's first bin, keyed on the inference midpoint
+        second = df["midpoint"].dt.floor("1s")
+        parallelism = df["parallelism"]
+        time_s = (second - second.groupby(parallelism, observed=True, sort=False).transform("min")) // pd.Timedelta(seconds=1)
+
+        # One count per (parallelism, second); seconds with no completions count as zero
+        counts = (
+            time_s.groupby([parallelism, time_s.rename("time_s")], observed=True)
+            .size()
+            .unstack(fill_value=0)
+            .stack()
+            .rename("inferences_per_sec")
+            .reset_index()
+        )
+
+        # Drop incomplete first/last bins, along with the zero padding past each run's end
+        run_last_s = time_s.groupby(parallelism, observed=True, sort=False).max()
+        last_s = run_last_s.reindex(counts["parallelism"]).to_numpy()
+
+        # Common time range (all groups have same extent): the shortest run's last complete bin
+        max_common_time = run_last_s[run_last_s > 1].min() - 1
+
+        keep = (counts["time_s"] > 0) & (counts["time_s"] < last_s) & (counts["time_s"] <= max_common_time)
+        return counts[keep].reset_index(drop=True)
 
     throughput_df = _()
     return (throughput_df,)
 
 
 @app.cell
-def _(df, perf_df):
+def _(parallelism_groups, perf_df):
     def _():
-        # For each parallelism level, extract bandwidth samples and bucket to 1-second bins
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            t_start = g["start_time"].min()
-            t_end = g["end_time"].max()
+        # Label each perf sample with the parallelism level whose run it falls in
+        runs = parallelism_groups.agg(t_start=("start_time", "min"), t_end=("end_time", "max")).sort_values("t_start")
+        t_start = runs["t_start"].values
+        t_end = runs["t_end"].values
+        timestamps = perf_df["timestamp"].values
 
-            # Filter perf samples to this run's time range
-            mask = (perf_df["timestamp"] >= t_start) & (perf_df["timestamp"] <= t_end)
-            run_perf = perf_df[mask].copy()
+        # Runs don't overlap, so the last run starting at or before a sample is the only candidate
+        run_idx = np.searchsorted(t_start, timestamps, side="right") - 1
+        in_run = (run_idx >= 0) & (timestamps <= t_end[run_idx])
+        return perf_df[in_run].assign(parallelism=runs.index[run_idx[in_run]])
 
-            if run_perf.empty:
-                continue
+    run_perf_df = _()
+    return (run_perf_df,)
+
+
+@app.cell
+def _(run_perf_df):
+    def _():
+        if run_perf_df.empty:
+            return pd.DataFrame()
+
+        # Average every perf metric over whole seconds per parallelism level in one pass
+        perf_cols = [
+            "bandwidth_gbps",
+            "memory_bound_pct",
+            "l1_bound_pct",
+            "l2_bound_pct",
+            "l3_bound_pct",
+            "dram_bound_pct",
+            "ipc",
+        ]
+        second = run_perf_df["timestamp"].dt.floor("1s").rename("second")
+        binned = run_perf_df[perf_cols].groupby([run_perf_df["parallelism"], second], observed=True).mean().reset_index()
+
+        # Whole seconds since each run's first bin
+        by_parallelism = binned.groupby("parallelism", observed=True, sort=False)
+        binned["time_s"] = (binned["second"] - by_parallelism["second"].transform("min")) // pd.Timedelta(seconds=1)
+
+        # Drop incomplete first/last bins
+        complete = (by_parallelism.cumcount() > 0) & (by_parallelism.cumcount(ascending=False) > 0)
+        return binned[complete].reset_index(drop=True)
+
+    perf_binned_df = _()
+    return (perf_binned_df,)
 
-            # Resample to 1-second bins, averaging bandwidth
-            run_perf = run_perf.set_index("timestamp")
-            binned = run_perf["bandwidth_gbps"].resample("1s").mean()
-            t0 = binned.index.min()
 
-            for ts, bw in binned.iloc[1:-1].items():  # Drop incomplete first/last bins
-                rows.append({
-                    "parallelism": parallelism,
-                    "time_s": (ts - t0).total_seconds(),
-                    "bandwidth_gbps": bw,
-                })
+@app.cell
+def _(perf_binned_df):
+    def _():
+        if perf_binned_df.empty:
+            return pd.DataFrame()
 
-        bandwidth_df = pd.DataFrame(rows)
+        bandwidth_df = perf_binned_df[["parallelism", "time_s", "bandwidth_gbps"]]
 
         # Filter to common time range (match throughput_df)
-        if not bandwidth_df.empty:
-            max_common_time = bandwidth_df.groupby("parallelism")["time_s"].max().min()
-            bandwidth_df = bandwidth_df[bandwidth_df["time_s"] <= max_common_time]
+        max_common_time = bandwidth_df.groupby("parallelism", observed=True, sort=False)["time_s"].max().min()
+        bandwidth_df = bandwidth_df[bandwidth_df["time_s"] <= max_common_time]
 
         return bandwidth_df
 
@@ -162,29 +268,22 @@ def _(df, perf_df):
 
 
 @app.cell
-def _(bandwidth_df, df):
+def _(bandwidth_df, parallelism_groups):
     def _():
-        stats_df = df.groupby("parallelism").apply(
-            lambda g: pd.Series({
-                "avg_throughput": round(len(g) / (g["end_time"].max() - g["start_time"].min()).total_seconds(), 2),
-            }),
-            include_groups=False,
-        ).reset_index()
-
-        # Add average bandwidth per parallelism level
+        runs = parallelism_groups.agg(n=("end_s", "size"), t_start=("start_s", "min"), t_end=("end_s", "max"))
+        avg_throughput = (runs["n"] / (runs["t_end"] - runs["t_start"])).round(2)
+        stats_df = avg_throughput.rename("avg_throughput").to_frame()
+
+        # Add average bandwidth per parallelism level, aligned on the shared parallelism index
         if not bandwidth_df.empty:
-            bw_avg = bandwidth_df.groupby("parallelism")["bandwidth_gbps"].mean().round(2)
-            stats_df = stats_df.merge(
-                bw_avg.rename("avg_bandwidth_gbps").reset_index(),
-                on="parallelism",
-                how="left",
-            )
+            bw_avg = bandwidth_df.groupby("parallelism", observed=True, sort=False)["bandwidth_gbps"].mean().round(2)
+            stats_df["avg_bandwidth_gbps"] = bw_avg
 
-        stats_df = stats_df.sort_values("parallelism")
+        stats_df = stats_df.sort_index().reset_index()
 
         # Marginal efficiency: incremental gain per additional core, relative to baseline
-        baseline_throughput = stats_df["avg_throughput"].iloc[0]
-        stats_df["throughput_marginal_eff"] = (stats_df["avg_throughput"].diff() / baseline_throughput).round(3)
+        throughput = stats_df["avg_throughput"].to_numpy()
+        stats_df["throughput_marginal_eff"] = np.round(np.diff(throughput, prepend=np.nan) / throughput[0], 3)
 
         return stats_df
 
@@ -196,41 +295,27 @@ def _(bandwidth_df, df):
 def _(bandwidth_df, throughput_df):
     def _():
         # Throughput over time
-        fig1, ax1 = plt.subplots(figsize=(12, 4))
-        sns.lineplot(
-            data=throughput_df,
-            x="time_s",
-            y="inferences_per_sec",
-            hue="parallelism",
-            ax=ax1,
-            palette="tab10",
-        )
+        fig1 = Figure(figsize=(12, 4), layout="constrained")
+        ax1 = fig1.subplots()
+        plot_by_parallelism(ax1, throughput_df, "inferences_per_sec")
         ax1.set_xlabel("Time (s)")
         ax1.set_ylabel("Inferences / second")
         ax1.set_title("Throughput Over Time by Parallelism")
         ax1.set_ylim(bottom=0)
         handles, labels = ax1.get_legend_handles_labels()
         ax1.legend(handles[::-1], labels[::-1], title="Parallelism", loc="upper left", bbox_to_anchor=(1, 1))
-        plt.tight_layout()
 
         # Bandwidth over time
-        fig2, ax2 = plt.subplots(figsize=(12, 4))
+        fig2 = Figure(figsize=(12, 4), layout="constrained")
+        ax2 = fig2.subplots()
         if not bandwidth_df.empty:
-            sns.lineplot(
-                data=bandwidth_df,
-                x="time_s",
-                y="bandwidth_gbps",
-                hue="parallelism",
-                ax=ax2,
-                palette="tab10",
-            )
+            plot_by_parallelism(ax2, bandwidth_df, "bandwidth_gbps")
             ax2.set_xlabel("Time (s)")
             ax2.set_ylabel("DRAM Bandwidth (GB/s)")
             ax2.set_title("Memory Bandwidth Over Time by Parallelism")
             ax2.set_ylim(bottom=0)
             handles, labels = ax2.get_legend_handles_labels()
             ax2.legend(handles[::-1], labels[::-1], title="Parallelism", loc="upper left", bbox_to_anchor=(1, 1))
-            plt.tight_layout()
 
         return fig1, fig2
 
@@ -244,13 +329,18 @@ def _(stats_df):
         if "avg_bandwidth_gbps" not in stats_df.columns:
             return None
 
-        fig, ax1 = plt.subplots(figsize=(10, 6))
+        parallelism = stats_df["parallelism"].to_numpy()
+        avg_throughput = stats_df["avg_throughput"].to_numpy()
+        avg_bandwidth_gbps = stats_df["avg_bandwidth_gbps"].to_numpy()
+
+        fig = Figure(figsize=(10, 6), layout="constrained")
+        ax1 = fig.subplots()
 
         # Left y-axis: throughput
         color1 = "#1a1a2e"
         ax1.plot(
-            stats_df["parallelism"],
-            stats_df["avg_throughput"],
+            parallelism,
+            avg_throughput,
             marker="o",
             color=color1,
             label="Throughput",
@@ -264,8 +354,8 @@ def _(stats_df):
         ax2 = ax1.twinx()
         color2 = "#e63946"
         ax2.plot(
-            stats_df["parallelism"],
-            stats_df["avg_bandwidth_gbps"],
+            parallelism,
+            avg_bandwidth_gbps,
             marker="s",
             color=color2,
             label="Bandwidth",
@@ -281,7 +371,6 @@ def _(stats_df):
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="lower right")
 
-        plt.tight_layout()
         return fig
 
     _()
@@ -289,40 +378,29 @@ def _(stats_df):
 
 
 @app.cell
-def _(df, perf_df):
+def _(perf_binned_df, run_perf_df):
     def _():
-        # Build TMA metrics dataframe
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            t_start = g["start_time"].min()
-            t_end = g["end_time"].max()
+        if perf_binned_df.empty:
+            return pd.DataFrame()
 
-            mask = (perf_df["timestamp"] >= t_start) & (perf_df["timestamp"] <= t_end)
-            run_perf = perf_df[mask].copy()
+        tma_cols = ["memory_bound_pct", "l1_bound_pct", "l2_bound_pct", "l3_bound_pct", "dram_bound_pct", "ipc"]
 
-            if run_perf.empty:
-                continue
-
-            run_perf = run_perf.set_index("timestamp")
-            t0 = run_perf.index.min()
+        # Time relative to each run's first perf sample, in int64 nanoseconds until the final divide
+        t0 = run_perf_df.groupby("parallelism", observed=True, sort=False)["timestamp"].min().reindex(perf_binned_df["parallelism"])
+        second_ns = perf_binned_df["second"].values.astype("datetime64[ns]").view("i8")
+        t0_ns = t0.values.astype("datetime64[ns]").view("i8")
 
-            for col in ["memory_bound_pct", "l1_bound_pct", "l2_bound_pct", "l3_bound_pct", "dram_bound_pct", "ipc"]:
-                binned = run_perf[col].resample("1s").mean()
-                for ts, val in binned.iloc[1:-1].items():
-                    rows.append({
-                        "parallelism": parallelism,
-                        "time_s": (ts - t0).total_seconds(),
-                        "metric": col,
-                        "value": val,
-                    })
-
-        tma_df = pd.DataFrame(rows)
+        tma_df = (
+            perf_binned_df[["parallelism", *tma_cols]]
+            .assign(time_s=(second_ns - t0_ns) / 1e9)
+            .melt(id_vars=["parallelism", "time_s"], value_vars=tma_cols, var_name="metric", value_name="value")
+        )
 
         if tma_df.empty:
             return tma_df
 
         # Filter to common time range
-        max_common_time = tma_df.groupby("parallelism")["time_s"].max().min()
+        max_common_time = tma_df.groupby("parallelism", observed=True, sort=False)["time_s"].max().min()
         return tma_df[tma_df["time_s"] <= max_common_time]
 
     tma_df = _()
@@ -336,7 +414,8 @@ def _(tma_df):
             return None
 
         # Memory bound breakdown by parallelism
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig = Figure(figsize=(10, 4), layout="constrained")
+        ax = fig.subplots()
 
         bound_metrics = ["l1_bound_pct", "l2_bound_pct", "l3_bound_pct", "dram_bound_pct"]
         labels = ["L1 Bound", "L2 Bound", "L3 Bound", "DRAM Bound"]
@@ -345,7 +424,7 @@ def _(tma_df):
             subset = tma_df[tma_df["metric"] == metric]
             if subset.empty:
                 continue
-            avg = subset.groupby("parallelism")["value"].mean().reset_index()
+            avg = subset.groupby("parallelism", observed=True)["value"].mean().reset_index()
             ax.plot(avg["parallelism"], avg["value"], marker="o", label=label)
 
         ax.axvline(x=8, color="red", linestyle="--", alpha=0.7)
@@ -362,7 +441,6 @@ def _(tma_df):
         ax.set_ylim(bottom=0)
         ax.set_xticks(tma_df["parallelism"].unique())
         ax.legend()
-        plt.tight_layout()
         return fig
 
     mo.vstack([_(), mo.md("Note that L1, L2, L3 stats are not collected for E-cores.\nIn between the non-SMT and SMT P-cores are E-cores")])
@@ -380,32 +458,26 @@ def _(tma_df):
             return None, None
 
         # IPC over time by parallelism
-        fig1, ax1 = plt.subplots(figsize=(12, 4))
-        sns.lineplot(
-            data=ipc_df,
-            x="time_s",
-            y="value",
-            hue="parallelism",
-            ax=ax1,
-            palette="tab10",
-        )
+        fig1 = Figure(figsize=(12, 4), layout="constrained")
+        ax1 = fig1.subplots()
+        plot_by_parallelism(ax1, ipc_df, "value")
         ax1.set_xlabel("Time (s)")
         ax1.set_ylabel("IPC")
         ax1.set_title("Instructions Per Cycle Over Time")
         handles, labels = ax1.get_legend_handles_labels()
         ax1.legend(handles[::-1], labels[::-1], title="Parallelism", loc="upper left", bbox_to_anchor=(1, 1))
-        plt.tight_layout()
 
         # Avg IPC vs parallelism
-        fig2, ax2 = plt.subplots(figsize=(10, 4))
-        avg_ipc = ipc_df.groupby("parallelism")["value"].mean().reset_index()
-        ax2.plot(avg_ipc["parallelism"], avg_ipc["value"], marker="o", linewidth=2)
+        fig2 = Figure(figsize=(10, 4), layout="constrained")
+        ax2 = fig2.subplots()
+        avg_ipc = ipc_df.groupby("parallelism", observed=True)["value"].mean()
+        parallelism = avg_ipc.index.to_numpy()
+        ax2.plot(parallelism, avg_ipc.to_numpy(), marker="o", linewidth=2)
         ax2.set_xlabel("Parallelism")
         ax2.set_ylabel("Avg IPC")
         ax2.set_title("Average IPC by Parallelism")
         ax2.set_ylim(bottom=0)
-        ax2.set_xticks(avg_ipc["parallelism"])
-        plt.tight_layout()
+        ax2.set_xticks(parallelism)
 
         return fig1, fig2
 
@@ -420,43 +492,33 @@ def _(stats_df):
 
 
 @app.cell
-def _(df):
+def _(df, parallelism_groups):
     def _():
-        # Compute duration for each inference
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            # Total std dev across all cores
-            total_std = g["duration_ms"].std()
-            total_var = g["duration_ms"].var()
-
-            # Intra-core std dev: std dev within each core, then average
-            per_core_stds = g.groupby("core_id")["duration_ms"].std()
-            per_core_vars = g.groupby("core_id")["duration_ms"].var()
-            intra_core_std = per_core_stds.mean()
-            intra_core_var = per_core_vars.mean()
-
-            # Heterogeneity variance: total_var - intra_core_var
-            # This represents variance from mixing different core types
-            heterogeneity_var = max(0, total_var - intra_core_var)
-            heterogeneity_std = np.sqrt(heterogeneity_var)
-
-            # Per-core mean durations (to see P-core vs E-core difference)
-            per_core_means = g.groupby("core_id")["duration_ms"].mean()
-
-            rows.append({
-                "parallelism": parallelism,
-                "total_std_ms": round(total_std, 3),
-                "intra_core_std_ms": round(intra_core_std, 3),
-                "heterogeneity_std_ms": round(heterogeneity_std, 3),
-                "heterogeneity_pct": round(100 * heterogeneity_var / total_var, 1) if total_var > 0 else 0,
-                "core_mean_min_ms": round(per_core_means.min(), 2),
-                "core_mean_max_ms": round(per_core_means.max(), 2),
-                "core_mean_spread_ms": round(per_core_means.max() - per_core_means.min(), 2),
-            })
-
-        return pd.DataFrame(rows)
+        per_core = df.groupby(["parallelism", "core_id"], observed=True, sort=False)["duration_ms"].agg(["std", "var", "mean"])
+        by_parallelism = per_core.groupby(level="parallelism", observed=True, sort=False)
+
+        # Total std dev across all cores
+        totals = parallelism_groups["duration_ms"].agg(["std", "var"])
+
+        # Intra-core std dev: std dev within each core, then average
+        intra_core = by_parallelism[["std", "var"]].mean()
+
+        # Heterogeneity variance: total_var - intra_core_var
+        # This represents variance from mixing different core types
+        heterogeneity_var = (totals["var"] - intra_core["var"]).clip(lower=0)
+
+        # Per-core mean durations (to see P-core vs E-core difference)
+        core_means = by_parallelism["mean"].agg(["min", "max"])
+
+        return pd.DataFrame({
+            "total_std_ms": totals["std"].round(3),
+            "intra_core_std_ms": intra_core["std"].round(3),
+            "heterogeneity_std_ms": np.sqrt(heterogeneity_var).round(3),
+            "heterogeneity_pct": (100 * heterogeneity_var / totals["var"]).where(totals["var"] > 0, 0).round(1),
+            "core_mean_min_ms": core_means["min"].round(2),
+            "core_mean_max_ms": core_means["max"].round(2),
+            "core_mean_spread_ms": (core_means["max"] - core_means["min"]).round(2),
+        }).reset_index()
 
     variance_breakdown_df = _()
     return
@@ -465,25 +527,12 @@ def _(df):
 @app.cell
 def _(df):
     def _():
-        # Compute duration for each inference
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-
-        # Classify cores: P-cores are 0-15, E-cores are 16-27
-        df["core_type"] = df["core_id"].apply(lambda c: "P-core" if c < 16 else "E-core")
-
         # Compute mean and std dev by parallelism and core type
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            for core_type, cg in g.groupby("core_type"):
-                rows.append({
-                    "parallelism": parallelism,
-                    "core_type": core_type,
-                    "mean_ms": cg["duration_ms"].mean(),
-                    "std_ms": cg["duration_ms"].std(),
-                    "count": len(cg),
-                })
-
-        return pd.DataFrame(rows)
+        return (
+            df.groupby(["parallelism", "core_type"], observed=True, sort=False)["duration_ms"]
+            .agg(mean_ms="mean", std_ms="std", count="count")
+            .reset_index()
+        )
 
     core_type_stats_df = _()
     return (core_type_stats_df,)
@@ -492,7 +541,8 @@ def _(df):
 @app.cell
 def _(core_type_stats_df):
     def _():
-        fig, ax1 = plt.subplots(figsize=(10, 5))
+        fig = Figure(figsize=(10, 5), layout="constrained")
+        ax1 = fig.subplots()
 
         # Pivot for easier plotting
         p_core = core_type_stats_df[core_type_stats_df["core_type"] == "P-core"].set_index("parallelism")
@@ -527,7 +577,6 @@ def _(core_type_stats_df):
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
 
-        plt.tight_layout()
         return fig
 
     _()
@@ -535,31 +584,13 @@ def _(core_type_stats_df):
 
 
 @app.cell
-def _(df):
+def _(parallelism_groups):
     def _():
-        # Compute duration and core type
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-        df["core_type"] = df["core_id"].apply(lambda c: "P-core" if c < 16 else "E-core")
-
-        # Compute throughput by parallelism and core type
-        rows = []
-        for parallelism, g in df.groupby("parallelism"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            for core_type in ["P-core", "E-core"]:
-                cg = g[g["core_type"] == core_type]
-                throughput = len(cg) / total_duration_s if total_duration_s > 0 else 0
-                rows.append({
-                    "parallelism": parallelism,
-                    "core_type": core_type,
-                    "throughput": throughput,
-                })
-
-        throughput_by_core_df = pd.DataFrame(rows)
-
-        # Pivot for stacking
-        pivot = throughput_by_core_df.pivot(index="parallelism", columns="core_type", values="throughput").fillna(0)
-
-        return pivot
+        # Compute throughput by parallelism and core type, one column per core type
+        runs = parallelism_groups.agg(t_start=("start_s", "min"), t_end=("end_s", "max"))
+        total_duration_s = runs["t_end"] - runs["t_start"]
+        counts = parallelism_groups["core_type"].value_counts().unstack(fill_value=0)
+        return counts.div(total_duration_s.where(total_duration_s > 0), axis=0).fillna(0)
 
     throughput_by_core_pivot = _()
     return (throughput_by_core_pivot,)
@@ -568,9 +599,10 @@ def _(df):
 @app.cell
 def _(throughput_by_core_pivot):
     def _():
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig = Figure(figsize=(10, 5), layout="constrained")
+        ax = fig.subplots()
 
-        parallelism = throughput_by_core_pivot.index.values
+        parallelism = throughput_by_core_pivot.index.to_numpy()
         p_core = throughput_by_core_pivot.get("P-core", pd.Series(0, index=parallelism)).values
         e_core = throughput_by_core_pivot.get("E-core", pd.Series(0, index=parallelism)).values
 
@@ -590,13 +622,23 @@ def _(throughput_by_core_pivot):
         ax.set_ylim(bottom=0)
         ax.set_xlim(parallelism.min(), parallelism.max())
 
-        plt.tight_layout()
         return fig
 
     _()
     return
 
 
+@app.cell
+def _(df):
+    # Duration stats per (core, parallelism), computed once so core dropdown changes only index into it
+    per_core_stats = df.groupby(["core_id", "parallelism"], observed=True)["duration_ms"].agg(
+        mean_ms="mean",
+        std_ms="std",
+        count="count",
+    )
+    return (per_core_stats,)
+
+
 @app.cell
 def _(df):
     def _():
@@ -613,38 +655,28 @@ def _(df):
 
 
 @app.cell
-def _(core_selector, df):
+def _(core_selector, per_core_stats):
     def _():
         selected_core = core_selector.value
         if selected_core is None:
             return None
 
-        # Compute duration
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-
-        # Filter to selected core and compute stats per parallelism
-        core_data = df[df["core_id"] == selected_core]
-
-        rows = []
-        for parallelism, g in core_data.groupby("parallelism"):
-            rows.append({
-                "parallelism": parallelism,
-                "mean_ms": g["duration_ms"].mean(),
-                "std_ms": g["duration_ms"].std(),
-                "count": len(g),
-            })
-
-        if not rows:
+        if selected_core not in per_core_stats.index:
             return mo.md(f"No data for core {selected_core}")
 
-        stats = pd.DataFrame(rows)
+        # Stats per parallelism for the selected core
+        stats = per_core_stats.loc[selected_core]
+        parallelism = stats.index.to_numpy()
+        std_ms = stats["std_ms"].to_numpy()
+        mean_ms = stats["mean_ms"].to_numpy()
 
         # Plot
-        fig, ax1 = plt.subplots(figsize=(10, 5))
+        fig = Figure(figsize=(10, 5), layout="constrained")
+        ax1 = fig.subplots()
 
         # Left axis: Std dev
         color1 = "#1a1a2e"
-        ax1.plot(stats["parallelism"], stats["std_ms"], marker="o", color=color1, linewidth=2, label="Std Dev")
+        ax1.plot(parallelism, std_ms, marker="o", color=color1, linewidth=2, label="Std Dev")
         ax1.set_xlabel("Parallelism")
         ax1.set_ylabel("Std Dev (ms)", color=color1)
         ax1.tick_params(axis="y", labelcolor=color1)
@@ -653,21 +685,20 @@ def _(core_selector, df):
         # Right axis: Mean
         ax2 = ax1.twinx()
         color2 = "#e63946"
-        ax2.plot(stats["parallelism"], stats["mean_ms"], marker="s", color=color2, linewidth=2, label="Mean")
+        ax2.plot(parallelism, mean_ms, marker="s", color=color2, linewidth=2, label="Mean")
         ax2.set_ylabel("Mean Duration (ms)", color=color2)
         ax2.tick_params(axis="y", labelcolor=color2)
         ax2.set_ylim(bottom=0)
 
         core_type = "P-core" if selected_core < 16 else "E-core"
         ax1.set_title(f"Core {selected_core} ({core_type}): Mean and Std Dev by Parallelism")
-        ax1.set_xticks(stats["parallelism"])
+        ax1.set_xticks(parallelism)
 
         # Combined legend
         lines1, labels1 = ax1.get_legend_handles_labels()
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
 
-        plt.tight_layout()
         return fig
 
     cores_viz = _()
@@ -701,38 +732,46 @@ def _(df):
 
 
 @app.cell
-def _(df, raw_core_selector):
+def _(df, per_core_stats, raw_core_selector):
     def _():
         selected_core = raw_core_selector.value
         if selected_core is None:
             return None
 
-        # Compute duration
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-
         # Filter to selected core
-        core_data = df[df["core_id"] == selected_core].copy()
+        core_data = df[df["core_id"] == selected_core]
 
         if core_data.empty:
             return mo.md(f"No data for core {selected_core}")
 
-        # Add jitter to parallelism for visibility
-        core_data["parallelism_jitter"] = core_data["parallelism"] + (np.random.rand(len(core_data)) - 0.5) * 0.3
+        parallelism = core_data["parallelism"].to_numpy()
+        duration_ms = core_data["duration_ms"].to_numpy()
 
-        # Plot
-        fig, ax = plt.subplots(figsize=(12, 5))
+        # Add jitter to parallelism for visibility, in place in a single buffer
+        parallelism_jitter = np.random.default_rng(0).random(len(parallelism), dtype=np.float32)
+        parallelism_jitter -= 0.5
+        parallelism_jitter *= 0.3
+        parallelism_jitter += parallelism
 
-        ax.scatter(
-            core_data["parallelism_jitter"],
-            core_data["duration_ms"],
+        # Plot
+        fig = Figure(figsize=(12, 5), layout="constrained", dpi=96)
+        ax = fig.subplots()
+
+        # A single rasterized marker line renders far faster than a scatter PathCollection
+        ax.plot(
+            parallelism_jitter,
+            duration_ms,
+            marker=".",
+            markersize=3,
+            linestyle="None",
             alpha=0.3,
-            s=10,
             color="#1a1a2e",
+            rasterized=True,
         )
 
         # Overlay mean line
-        means = core_data.groupby("parallelism")["duration_ms"].mean()
-        ax.plot(means.index, means.values, marker="o", color="#e63946", linewidth=2, label="Mean", zorder=10)
+        means = per_core_stats.loc[selected_core, "mean_ms"]
+        ax.plot(means.index.to_numpy(), means.to_numpy(), marker="o", color="#e63946", linewidth=2, label="Mean", zorder=10)
 
         ax.set_xlabel("Parallelism")
         ax.set_ylabel("Duration (ms)")
@@ -740,10 +779,9 @@ def _(df, raw_core_selector):
 
         core_type = "P-core" if selected_core < 16 else "E-core"
         ax.set_title(f"Core {selected_core} ({core_type}): Raw Duration Measurements")
-        ax.set_xticks(sorted(core_data["parallelism"].unique()))
+        ax.set_xticks(np.unique(parallelism))
         ax.legend(loc="upper left")
 
-        plt.tight_layout()
         return fig
 
     raw_duration_viz = _()
@@ -765,33 +803,37 @@ def _(raw_duration_viz):
 @app.cell
 def _(df):
     def _():
-        # Compute duration
-        df["duration_ms"] = (df["end_time"] - df["start_time"]).dt.total_seconds() * 1000
-
-        # Filter to P-cores only (core_id < 16) and parallelism <= 8
-        p_core_df = df[(df["core_id"] < 16) & (df["parallelism"] <= 8)]
-
-        rows = []
-        for parallelism, g in p_core_df.groupby("parallelism"):
+        # Filter to P-cores only (core_id < 16) and parallelism <= 8; compare on the numeric level,
+        # since the ordered categorical only admits comparisons against its own categories
+        p_core_df = df[(df["core_id"] < 16) & (df["parallelism"].astype(int) <= 8)]
+
+        columns = {
+            "parallelism": [],
+            "fastest_core": [],
+            "fastest_mean_ms": [],
+            "slowest_core": [],
+            "slowest_mean_ms": [],
+            "spread_ms": [],
+        }
+        for parallelism, g in p_core_df.groupby("parallelism", observed=True):
             # Compute mean duration per core at this parallelism level
-            core_means = g.groupby("core_id")["duration_ms"].mean()
+            core_means = g.groupby("core_id", observed=True, sort=False)["duration_ms"].mean()
 
             fastest_core = core_means.idxmin()
             slowest_core = core_means.idxmax()
 
-            rows.append({
-                "parallelism": parallelism,
-                "fastest_core": fastest_core,
-                "fastest_mean_ms": core_means[fastest_core],
-                "slowest_core": slowest_core,
-                "slowest_mean_ms": core_means[slowest_core],
-                "spread_ms": core_means[slowest_core] - core_means[fastest_core],
-            })
+            columns["parallelism"].append(parallelism)
+            columns["fastest_core"].append(fastest_core)
+            columns["fastest_mean_ms"].append(core_means[fastest_core])
+            columns["slowest_core"].append(slowest_core)
+            columns["slowest_mean_ms"].append(core_means[slowest_core])
+            columns["spread_ms"].append(core_means[slowest_core] - core_means[fastest_core])
 
-        stats = pd.DataFrame(rows)
+        stats = pd.DataFrame(columns)
 
         # Plot
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig = Figure(figsize=(10, 5), layout="constrained")
+        ax = fig.subplots()
 
         ax.fill_between(
             stats["parallelism"],
@@ -818,8 +860,6 @@ def _(df):
         ax.legend()
         ax.set_ylim(bottom=0)
 
-        plt.tight_layout()
-
         max_spread = stats["spread_ms"].max()
         max_spread_row = stats.loc[stats["spread_ms"].idxmax()]
         summary = mo.md(f"**Maximum P-core spread:** {max_spread:.1f}ms at parallelism {int(max_spread_row['parallelism'])} (core {int(max_spread_row['fastest_core'])} vs core {int(max_spread_row['slowest_core'])})")
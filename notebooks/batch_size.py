@@ -66,20 +66,18 @@ def _(model_input):
         estimated_total = len(batch_sizes) * (warmup + duration + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"batch_size": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="Running benchmark...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for batch_size in batch_sizes:
                 for start_time, end_time, _ in run_benchmark(make_cmd(batch_size), duration, warmup):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "batch_size": batch_size,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
+                    columns["batch_size"].append(batch_size)
+                    columns["start_time"].append(start_time)
+                    columns["end_time"].append(end_time)
 
-        return pd.DataFrame(rows)
+        return pd.DataFrame(columns)
 
     df = _()
     return (df,)
@@ -88,20 +86,16 @@ def _(model_input):
 @app.cell
 def _(df):
     def _():
-        rows = []
-        for batch_size, g in df.groupby("batch_size"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            num_inferences = len(g)
-            total_images = num_inferences * batch_size
-
-            rows.append({
-                "batch_size": batch_size,
-                "num_inferences": num_inferences,
-                "total_images": total_images,
-                "images_per_sec": round(total_images / total_duration_s, 2),
-            })
-
-        return pd.DataFrame(rows)
+        runs = df.groupby("batch_size")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        num_inferences = runs.size()
+        total_images = num_inferences * num_inferences.index
+
+        return pd.DataFrame({
+            "num_inferences": num_inferences,
+            "total_images": total_images,
+            "images_per_sec": (total_images / total_duration_s).round(2),
+        }).reset_index()
 
     stats_df = _()
     return (stats_df,)
@@ -46,7 +46,7 @@ def _():
         estimated_total = len(e_core_configs) * (WARMUP + DURATION + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"core_count": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="1/4: SVTR scaling (no interference)...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for e_cores in e_core_configs:
@@ -57,23 +57,15 @@ def _():
                 for start_time, end_time, tags in run_benchmark(cmd, DURATION, WARMUP):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "core_count": len(e_cores),
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
+                    columns["core_count"].append(len(e_cores))
+                    columns["start_time"].append(start_time)
+                    columns["end_time"].append(end_time)
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(columns)
 
-        stats_rows = []
-        for core_count, g in df.groupby("core_count"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            stats_rows.append({
-                "core_count": core_count,
-                "throughput": len(g) / total_duration_s,
-            })
-
-        return pd.DataFrame(stats_rows).sort_values("core_count")
+        runs = df.groupby("core_count")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        return (runs.size() / total_duration_s).rename("throughput").reset_index()
 
     svtr_alone = _()
     return (svtr_alone,)
@@ -88,7 +80,7 @@ def _():
         estimated_total = len(e_core_configs) * (WARMUP + DURATION + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"core_count": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="2/4: SVTR scaling (max DbNet interference)...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for e_cores in e_core_configs:
@@ -101,23 +93,15 @@ def _():
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
                     if tags.get("model") == "svtr":
-                        rows.append({
-                            "core_count": len(e_cores),
-                            "start_time": start_time,
-                            "end_time": end_time,
-                        })
-
-        df = pd.DataFrame(rows)
+                        columns["core_count"].append(len(e_cores))
+                        columns["start_time"].append(start_time)
+                        columns["end_time"].append(end_time)
 
-        stats_rows = []
-        for core_count, g in df.groupby("core_count"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            stats_rows.append({
-                "core_count": core_count,
-                "throughput": len(g) / total_duration_s,
-            })
+        df = pd.DataFrame(columns)
 
-        return pd.DataFrame(stats_rows).sort_values("core_count")
+        runs = df.groupby("core_count")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        return (runs.size() / total_duration_s).rename("throughput").reset_index()
 
     svtr_with_dbnet = _()
     return (svtr_with_dbnet,)
@@ -132,7 +116,7 @@ def _():
         estimated_total = len(p_core_configs) * (WARMUP + DURATION + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"core_count": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="3/4: DbNet scaling (no interference)...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for p_cores in p_core_configs:
@@ -143,23 +127,15 @@ def _():
                 for start_time, end_time, tags in run_benchmark(cmd, DURATION, WARMUP):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "core_count": len(p_cores),
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
-
-        df = pd.DataFrame(rows)
+                    columns["core_count"].append(len(p_cores))
+                    columns["start_time"].append(start_time)
+                    columns["end_time"].append(end_time)
 
-        stats_rows = []
-        for core_count, g in df.groupby("core_count"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            stats_rows.append({
-                "core_count": core_count,
-                "throughput": len(g) / total_duration_s,
-            })
+        df = pd.DataFrame(columns)
 
-        return pd.DataFrame(stats_rows).sort_values("core_count")
+        runs = df.groupby("core_count")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        return (runs.size() / total_duration_s).rename("throughput").reset_index()
 
     dbnet_alone = _()
     return (dbnet_alone,)
@@ -174,7 +150,7 @@ def _():
         estimated_total = len(p_core_configs) * (WARMUP + DURATION + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"core_count": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="4/4: DbNet scaling (max SVTR interference)...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for p_cores in p_core_configs:
@@ -187,23 +163,15 @@ def _():
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
                     if tags.get("model") == "dbnet":
-                        rows.append({
-                            "core_count": len(p_cores),
-                            "start_time": start_time,
-                            "end_time": end_time,
-                        })
-
-        df = pd.DataFrame(rows)
-
-        stats_rows = []
-        for core_count, g in df.groupby("core_count"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            stats_rows.append({
-                "core_count": core_count,
-                "throughput": len(g) / total_duration_s,
-            })
-
-        return pd.DataFrame(stats_rows).sort_values("core_count")
+                        columns["core_count"].append(len(p_cores))
+                        columns["start_time"].append(start_time)
+                        columns["end_time"].append(end_time)
+
+        df = pd.DataFrame(columns)
+
+        runs = df.groupby("core_count")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        return (runs.size() / total_duration_s).rename("throughput").reset_index()
 
     dbnet_with_svtr = _()
     return (dbnet_with_svtr,)
@@ -51,7 +51,7 @@ def _():
         estimated_total = len(configs) * (WARMUP + DURATION + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"dbnet_cores": [], "model": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="Running full system benchmark...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             perf = start_perf()
@@ -64,27 +64,18 @@ def _():
                 for start_time, end_time, tags in run_benchmark(cmd, DURATION, WARMUP):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "dbnet_cores": len(dbnet_cores),
-                        "model": tags.get("model", "unknown"),
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
+                    columns["dbnet_cores"].append(len(dbnet_cores))
+                    columns["model"].append(tags.get("model", "unknown"))
+                    columns["start_time"].append(start_time)
+                    columns["end_time"].append(end_time)
             perf_df = perf.stop()
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(columns)
 
         # Compute stats: throughput by (dbnet_cores, model)
-        stats_rows = []
-        for (dbnet_cores, model), g in df.groupby(["dbnet_cores", "model"]):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            stats_rows.append({
-                "dbnet_cores": dbnet_cores,
-                "model": model,
-                "throughput": len(g) / total_duration_s,
-            })
-
-        stats_df = pd.DataFrame(stats_rows).sort_values(["dbnet_cores", "model"])
+        runs = df.groupby(["dbnet_cores", "model"])
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        stats_df = (runs.size() / total_duration_s).rename("throughput").reset_index()
         return df, perf_df, stats_df
 
     df, perf_df, full_system_stats = _()
@@ -135,12 +126,13 @@ def _(df, full_system_stats, perf_df):
 
         # Bottom plot: DRAM bandwidth vs DbNet P-core count
         if not perf_df.empty:
+            # Index perf samples by time once so each run is a binary-searched slice
+            perf_by_time = perf_df.set_index("timestamp").sort_index()
             bw_rows = []
             for dbnet_cores, g in df.groupby("dbnet_cores"):
                 t_start = g["start_time"].min()
                 t_end = g["end_time"].max()
-                mask = (perf_df["timestamp"] >= t_start) & (perf_df["timestamp"] <= t_end)
-                run_perf = perf_df[mask]
+                run_perf = perf_by_time.loc[t_start:t_end]
                 if not run_perf.empty:
                     bw_rows.append({
                         "dbnet_cores": dbnet_cores,
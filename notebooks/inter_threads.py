@@ -60,20 +60,18 @@ def _(model_input):
         estimated_total = len(thread_counts) * (warmup + duration + 1)
         start_time_estimate = time.time()
 
-        rows = []
+        columns = {"inter_threads": [], "start_time": [], "end_time": []}
         with mo.status.spinner(title="Running benchmark...", remove_on_exit=True) as spinner:
             spinner.update(subtitle=f"0s / {format_duration(estimated_total)}")
             for threads in thread_counts:
                 for start_time, end_time, _ in run_benchmark(make_cmd(threads), duration, warmup):
                     elapsed = time.time() - start_time_estimate
                     spinner.update(subtitle=f"{format_duration(elapsed)} / {format_duration(estimated_total)}")
-                    rows.append({
-                        "inter_threads": threads,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                    })
+                    columns["inter_threads"].append(threads)
+                    columns["start_time"].append(start_time)
+                    columns["end_time"].append(end_time)
 
-        return pd.DataFrame(rows)
+        return pd.DataFrame(columns)
 
     df = _()
     return (df,)
@@ -82,18 +80,14 @@ def _(model_input):
 @app.cell
 def _(df):
     def _():
-        rows = []
-        for threads, g in df.groupby("inter_threads"):
-            total_duration_s = (g["end_time"].max() - g["start_time"].min()).total_seconds()
-            num_inferences = len(g)
-
-            rows.append({
-                "inter_threads": threads,
-                "num_inferences": num_inferences,
-                "inferences_per_sec": round(num_inferences / total_duration_s, 2),
-            })
-
-        return pd.DataFrame(rows)
+        runs = df.groupby("inter_threads")
+        total_duration_s = (runs["end_time"].max() - runs["start_time"].min()).dt.total_seconds()
+        num_inferences = runs.size()
+
+        return pd.DataFrame({
+            "num_inferences": num_inferences,
+            "inferences_per_sec": (num_inferences / total_duration_s).round(2),
+        }).reset_index()
 
     stats_df = _()
     return (stats_df,)
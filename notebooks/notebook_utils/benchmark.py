@@ -1,7 +1,8 @@
 import json
 import os
-import select
+import selectors
 import subprocess
+from collections.abc import Sequence
 from datetime import datetime
 
 
@@ -9,6 +10,7 @@ def run_benchmark(
     cmd: list[str],
     duration: float,
     warmup: float,
+    cores: Sequence[int] | None = None,
 ):
     """
     Run a benchmark command and yield results as they stream in.
@@ -20,6 +22,8 @@ def run_benchmark(
         cmd: Command to run (e.g., ["dotnet", "run", "script.cs", "--", "-m", "dbnet"])
         duration: Benchmark duration in seconds (passed as -d)
         warmup: Warmup duration in seconds (passed as -w)
+        cores: Cores the benchmark is pinned to. While it runs, the calling thread is moved
+            onto the remaining cores so parsing does not contend with the measurement.
 
     Yields:
         (start_time, end_time, tags) tuples as they arrive.
@@ -30,54 +34,69 @@ def run_benchmark(
         full_cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
     )
 
+    # Only move off the measurement cores after spawning, so the child keeps the full affinity mask
+    original_affinity = os.sched_getaffinity(0)
+    free_cores = original_affinity - set(cores or ())
+    if cores and free_cores:
+        os.sched_setaffinity(0, free_cores)
+    try:
+        yield from _stream_results(proc)
+    finally:
+        os.sched_setaffinity(0, original_affinity)
+
+
+def _stream_results(proc: subprocess.Popen):
     # Make stdout non-blocking
     fd = proc.stdout.fileno()
     os.set_blocking(fd, False)
 
-    buffer = ""
+    buffer = bytearray()
     non_json_output = []
 
-    def parse_line(line: str):
-        if not line.startswith("{"):
-            non_json_output.append(line)
+    def parse_line(line: bytes | bytearray):
+        # json.loads takes bytes directly, so only non-JSON lines are ever decoded
+        if not line.startswith(b"{"):
+            non_json_output.append(line.decode(errors="replace"))
             return None
         obj = json.loads(line)
         return (
-            datetime.fromisoformat(obj["start"].replace("Z", "+00:00")),
-            datetime.fromisoformat(obj["end"].replace("Z", "+00:00")),
+            datetime.fromisoformat(obj["start"]),
+            datetime.fromisoformat(obj["end"]),
             obj.get("tags", {}),
         )
 
-    while proc.poll() is None:
-        ready, _, _ = select.select([proc.stdout], [], [], 0.1)
+    # Block until output arrives rather than waking on a fixed interval. Reads go straight to
+    # the raw fd and lines are split as bytes
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        eof = False
+        while not eof:
+            for _ in sel.select():
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    eof = True
+                    break
 
-        if ready:
-            chunk = proc.stdout.read()
-            if chunk:
+                # Split every complete line out of the buffer at once, carrying over the partial tail
                 buffer += chunk
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
                     line = line.strip()
                     if line:
                         result = parse_line(line)
                         if result:
                             yield result
 
-    # Read any remaining output
-    leftover = proc.stdout.read()
-    if leftover:
-        buffer += leftover
-    for line in buffer.strip().split("\n"):
-        line = line.strip()
-        if line:
-            result = parse_line(line)
-            if result:
-                yield result
-
-    stderr_output = proc.stderr.read()
+    line = buffer.strip()
+    if line:
+        result = parse_line(line)
+        if result:
+            yield result
+
+    proc.wait()
+    stderr_output = proc.stderr.read().decode(errors="replace")
 
     if proc.returncode != 0:
         stdout_output = "\n".join(non_json_output)
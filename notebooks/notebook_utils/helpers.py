@@ -1,3 +1,7 @@
+from functools import cache
+from itertools import accumulate
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable form"""
     if seconds < 60:
@@ -12,7 +16,8 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {mins}m"
 
 
-def prioritized_cores(max_cores: int) -> list[list[int]]:
+@cache
+def prioritized_cores(max_cores: int) -> tuple[tuple[int, ...], ...]:
     """
     Generate core configurations prioritized for i7-14700K topology.
 
@@ -22,14 +27,13 @@ def prioritized_cores(max_cores: int) -> list[list[int]]:
 
     Priority order: P-core physical -> E-cores -> P-core SMT
 
-    Returns list of core configs: [[0], [0,2], [0,2,4], ...]
+    Returns core configs: ((0,), (0,2), (0,2,4), ...). Results are cached per max_cores,
+    so they are returned as tuples to keep callers from mutating the shared value.
     """
     p_physical = [0, 2, 4, 6, 8, 10, 12, 14]
     e_cores = list(range(16, 28))
     p_smt = [1, 3, 5, 7, 9, 11, 13, 15]
     priority_order = p_physical + e_cores + p_smt
 
-    result = []
-    for n in range(1, min(max_cores, len(priority_order)) + 1):
-        result.append(priority_order[:n])
-    return result
+    # Each config extends the previous one by a core, so build the prefixes as a running sum of 1-tuples
+    return tuple(accumulate((core,) for core in priority_order[:max(max_cores, 0)]))
@@ -1,11 +1,13 @@
+import io
 import os
 import signal
 import subprocess
-import tempfile
+import threading
 import time
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 
 
@@ -41,13 +43,22 @@ class PerfMeasurement:
         "tma_dram_bound",
     ]
 
+    # Output column each P+E summed TMA metric is accumulated into
+    _METRIC_COLUMNS = {
+        "tma_memory_bound": "memory_bound_pct",
+        "tma_l1_bound": "l1_bound_pct",
+        "tma_l2_bound": "l2_bound_pct",
+        "tma_l3_bound": "l3_bound_pct",
+        "tma_dram_bound": "dram_bound_pct",
+    }
+
     def __init__(self, interval_ms: int = 250):
-        self._output_file = tempfile.mktemp(suffix=".csv")
         self._start_time = datetime.now(timezone.utc)
         self._interval_ms = interval_ms
 
         events = ",".join(self.EVENTS)
         metrics = ",".join(self.METRICS)
+        read_fd, write_fd = os.pipe()
 
         self._proc = subprocess.Popen(
             [
@@ -56,122 +67,90 @@ class PerfMeasurement:
                 "-M", metrics,
                 "-I", str(interval_ms),
                 "-x", ",",
-                "-o", self._output_file,
+                "--log-fd", str(write_fd),
             ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            pass_fds=(write_fd,),
         )
+        os.close(write_fd)
+
+        # Drain perf's output as it is written so nothing round-trips through disk
+        self._chunks: deque[bytes] = deque()
+        self._reader = threading.Thread(target=self._read_output, args=(read_fd,), daemon=True)
+        self._reader.start()
         time.sleep(0.1)  # Let perf initialize
 
+    def _read_output(self, fd: int):
+        with os.fdopen(fd, "rb", buffering=0) as pipe:
+            while chunk := pipe.read(65536):
+                self._chunks.append(chunk)
+
     def stop(self) -> pd.DataFrame:
         """Stop measurement and return DataFrame with derived metrics."""
         self._proc.send_signal(signal.SIGINT)
         self._proc.wait(timeout=5)
-        time.sleep(0.2)  # Let perf flush output
-
-        df = self._parse_output()
-        os.unlink(self._output_file)
-        return df
-
-    def _parse_output(self) -> pd.DataFrame:
-        # Collect raw values and derived metrics grouped by timestamp
-        samples = defaultdict(lambda: {
-            "instructions": 0.0,
-            "cycles": 0.0,
-            "bandwidth_gbps": 0.0,
-            "memory_bound_pct": 0.0,
-            "l1_bound_pct": 0.0,
-            "l2_bound_pct": 0.0,
-            "l3_bound_pct": 0.0,
-            "dram_bound_pct": 0.0,
+        # perf has exited, so the pipe reaches EOF once the reader drains what is left
+        self._reader.join()
+        return self._parse_output(b"".join(self._chunks).decode())
+
+    def _parse_output(self, output: str) -> pd.DataFrame:
+        columns = [
+            "timestamp",
+            "bandwidth_gbps",
+            "memory_bound_pct",
+            "l1_bound_pct",
+            "l2_bound_pct",
+            "l3_bound_pct",
+            "dram_bound_pct",
+            "ipc",
+        ]
+
+        # perf stat -x , -I rows: time,value,unit,event,run_time,pct_enabled,metric_value,metric_name
+        try:
+            raw = pd.read_csv(
+                io.StringIO(output),
+                header=None,
+                names=["time", "value", "unit", "event", "run_time", "pct_enabled", "metric_value", "metric_name"],
+                dtype=str,
+                comment="#",
+                on_bad_lines="skip",
+                engine="c",
+            )
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame(columns=columns)
+
+        raw["time"] = pd.to_numeric(raw["time"].str.strip(), errors="coerce")
+        raw = raw[raw["time"].notna()]
+        times = raw["time"]
+
+        # Sum instructions and cycles from both core types; "<not counted>" values count as zero
+        value = pd.to_numeric(raw["value"].str.strip(), errors="coerce").astype(float).fillna(0.0)
+        event = raw["event"].fillna("").str.lower()
+        is_instructions = event.str.contains("instructions", regex=False)
+        is_cycles = ~is_instructions & event.str.contains("cycles", regex=False) & ~event.str.contains("unhalted", regex=False)
+        counters = pd.DataFrame({
+            "instructions": value.where(is_instructions, 0.0),
+            "cycles": value.where(is_cycles, 0.0),
         })
 
-        with open(self._output_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                parts = line.split(",")
-                if len(parts) < 4:
-                    continue
-
-                try:
-                    relative_secs = float(parts[0])
-                except ValueError:
-                    continue
-
-                s = samples[relative_secs]
-
-                # Parse raw event value
-                value_str = parts[1].strip()
-                if value_str and not value_str.startswith("<"):
-                    try:
-                        value = float(value_str)
-                    except ValueError:
-                        value = 0.0
-                else:
-                    value = 0.0
-
-                # Get event name from parts[3] (e.g., "cpu_core/instructions/")
-                event_name = parts[3].strip() if len(parts) > 3 else ""
-
-                # Sum instructions and cycles from both core types
-                if "instructions" in event_name.lower():
-                    s["instructions"] += value
-                elif "cycles" in event_name.lower() and "unhalted" not in event_name.lower():
-                    s["cycles"] += value
-
-                # Check for TMA derived metrics (appear at end of line)
-                # Format: ...,derived_value,%  tma_metric_name  (for percentages)
-                # Format: ...,derived_value,tma_metric_name     (for bandwidth)
-                for i in range(len(parts) - 1, 3, -1):
-                    part = parts[i].strip()
-                    # Strip leading "%" and whitespace from metric name
-                    if part.startswith("%"):
-                        part = part[1:].strip()
-
-                    if part.startswith("tma_"):
-                        try:
-                            derived_value = float(parts[i - 1].strip())
-                        except (ValueError, IndexError):
-                            break
-
-                        if part == "tma_info_system_dram_bw_use":
-                            s["bandwidth_gbps"] = derived_value
-                        elif part == "tma_memory_bound":
-                            # Sum memory_bound from P and E cores
-                            s["memory_bound_pct"] += derived_value
-                        elif part == "tma_l1_bound":
-                            s["l1_bound_pct"] += derived_value
-                        elif part == "tma_l2_bound":
-                            s["l2_bound_pct"] += derived_value
-                        elif part == "tma_l3_bound":
-                            s["l3_bound_pct"] += derived_value
-                        elif part == "tma_dram_bound":
-                            s["dram_bound_pct"] += derived_value
-                        break
-
-        # Build output DataFrame
-        rows = []
-        for relative_secs in sorted(samples.keys()):
-            s = samples[relative_secs]
-            absolute_time = self._start_time + timedelta(seconds=relative_secs)
-
-            ipc = s["instructions"] / s["cycles"] if s["cycles"] > 0 else 0.0
-
-            rows.append({
-                "timestamp": absolute_time,
-                "bandwidth_gbps": s["bandwidth_gbps"],
-                "memory_bound_pct": s["memory_bound_pct"],
-                "l1_bound_pct": s["l1_bound_pct"],
-                "l2_bound_pct": s["l2_bound_pct"],
-                "l3_bound_pct": s["l3_bound_pct"],
-                "dram_bound_pct": s["dram_bound_pct"],
-                "ipc": ipc,
-            })
-
-        return pd.DataFrame(rows)
+        # Derived metrics sit in the last two fields, with a leading "%" on percentages
+        metric = raw["metric_name"].fillna("").str.lstrip("% ").str.strip()
+        metric_value = pd.to_numeric(raw["metric_value"].str.strip(), errors="coerce").astype(float)
+        for name, column in self._METRIC_COLUMNS.items():
+            counters[column] = metric_value.where(metric == name)
+
+        samples = counters.groupby(times, sort=True).sum()
+        # DRAM bandwidth is system-wide, so keep the last reported value rather than summing
+        samples["bandwidth_gbps"] = metric_value.where(metric == "tma_info_system_dram_bw_use").groupby(times).last()
+        samples = samples.fillna(0.0)
+
+        instructions = samples["instructions"].to_numpy()
+        cycles = samples["cycles"].to_numpy()
+        ipc = np.divide(instructions, cycles, out=np.zeros_like(instructions), where=cycles > 0)
+
+        timestamps = pd.Timestamp(self._start_time) + pd.to_timedelta(np.round(samples.index.to_numpy() * 1e6), unit="us")
+        return samples.assign(timestamp=timestamps, ipc=ipc).reset_index(drop=True)[columns]
 
 
 def start_perf(interval_ms: int = 250) -> PerfMeasurement:
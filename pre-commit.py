@@ -16,6 +16,8 @@ Usage:
 
 import hashlib
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -27,25 +29,29 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 
 def get_modification_hash() -> str:
     """Get a hash of modification times for all tracked and untracked non-ignored files."""
-    files_output = bash(
-        "git ls-files --cached --others --exclude-standard",
-        directory=SCRIPT_DIR,
+    result = subprocess.run(
+        ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+        cwd=SCRIPT_DIR,
+        capture_output=True,
     )
+    if result.returncode != 0:
+        raise ScriptError(f"git ls-files failed: {result.stderr.decode(errors='replace').strip()}")
 
-    entries = []
-    for filename in files_output.strip().split("\n"):
-        if not filename:
-            continue
-        filepath = SCRIPT_DIR / filename
+    filenames = sorted(name for name in result.stdout.split(b"\0") if name)
+
+    def stat_mtime(filename: bytes) -> int | None:
         try:
-            mtime = os.stat(filepath).st_mtime_ns
-            entries.append(f"{mtime} {filename}")
+            return os.stat(os.path.join(bytes(SCRIPT_DIR), filename)).st_mtime_ns
         except OSError:
-            pass
-
-    entries.sort()
-    content = "\n".join(entries)
-    return hashlib.sha256(content.encode()).hexdigest()
+            return None
+
+    # os.stat releases the GIL, so the stats overlap; map preserves the sorted order for hashing
+    hasher = hashlib.sha256()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        for filename, mtime in zip(filenames, pool.map(stat_mtime, filenames)):
+            if mtime is not None:
+                hasher.update(b"%d %s\n" % (mtime, filename))
+    return hasher.hexdigest()
 
 
 @click.command()
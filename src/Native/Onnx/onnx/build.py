@@ -15,6 +15,8 @@ Usage:
     ./build.py --version 1.15.0 --musl
 """
 
+import hashlib
+import os
 import shutil
 import time
 import psutil
@@ -30,6 +32,9 @@ ONNXRUNTIME_URL = "https://github.com/microsoft/onnxruntime.git"
 PATCHES_DIR = SCRIPT_DIR / "patches"
 OUT_DIR = SCRIPT_DIR / "out"
 
+# Directories under the onnxruntime checkout that never contain build outputs
+NON_OUTPUT_DIRS = {".git", ".venv", "CMakeFiles"}
+
 
 def get_parallel_jobs() -> int:
     """Calculate safe number of parallel jobs based on available memory (1 job per 1.5GB)."""
@@ -49,11 +54,19 @@ def create_venv() -> Path:
         info("Creating ONNX Python environment")
         bash(f"uv venv {venv_dir} --python 3.11", directory=ONNXRUNTIME_DIR)
 
+    # Skip the sync entirely when the venv was last synced against these exact requirements
+    stamp_file = venv_dir / ".requirements.sha256"
+    requirements_hash = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+    if stamp_file.exists() and stamp_file.read_text() == requirements_hash:
+        info("ONNX Python dependencies up to date")
+        return venv_dir
+
     info("Installing ONNX Python dependencies")
     bash(
         f"uv pip sync --python {venv_dir}/bin/python {requirements_file}",
         directory=ONNXRUNTIME_DIR,
     )
+    stamp_file.write_text(requirements_hash)
 
     return venv_dir
 
@@ -66,6 +79,22 @@ def apply_musl_patches():
         bash(f"patch -p1 -N < {no_execinfo_patch} || true", directory=ONNXRUNTIME_DIR)
 
 
+def find_release_outputs() -> tuple[list[Path], list[Path]]:
+    """Find static libraries and libonnxruntime.so under any Release directory in a single walk."""
+    static_libs = []
+    shared_libs = []
+    for root, dirs, files in os.walk(ONNXRUNTIME_DIR):
+        dirs[:] = [d for d in dirs if d not in NON_OUTPUT_DIRS]
+        if "Release" not in Path(root).relative_to(ONNXRUNTIME_DIR).parts:
+            continue
+        for name in files:
+            if name.endswith(".a"):
+                static_libs.append(Path(root, name))
+            elif name == "libonnxruntime.so":
+                shared_libs.append(Path(root, name))
+    return static_libs, shared_libs
+
+
 def combine_static_libs(libs: list[Path], output_path: Path):
     """Combine multiple .a files into a single archive using AR MRI script."""
     mri_script = output_path.parent / "combine.mri"
@@ -143,7 +172,7 @@ def build(onnx_version: str, musl: bool):
     include_dir.mkdir(parents=True, exist_ok=True)
 
     # Combine static libraries
-    static_libs = list(ONNXRUNTIME_DIR.rglob("Release/**/*.a"))
+    static_libs, shared_libs = find_release_outputs()
     info(f"Found {len(static_libs)} static libraries")
 
     combined_archive = static_dir / "onnxruntime.a"
@@ -152,7 +181,6 @@ def build(onnx_version: str, musl: bool):
     info(f"Created {combined_archive}")
 
     # Copy and patch shared library
-    shared_libs = list(ONNXRUNTIME_DIR.rglob("Release/**/libonnxruntime.so"))
     if shared_libs:
         for so in shared_libs:
             dest = shared_dir / "libonnxruntime.so"